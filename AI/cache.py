@@ -0,0 +1,140 @@
+import os
+import sqlite3
+import time
+
+import numpy as np
+from Logic.Board import Board
+from AI.transposition import cellsKey
+
+# The eight symmetries of the board as (row, col) -> (row, col) maps
+_SYMMETRIES = [
+    lambda r, c: (r, c),
+    lambda r, c: (c, 7 - r),
+    lambda r, c: (7 - r, 7 - c),
+    lambda r, c: (7 - c, r),
+    lambda r, c: (c, r),
+    lambda r, c: (7 - r, c),
+    lambda r, c: (7 - c, 7 - r),
+    lambda r, c: (r, 7 - c),
+]
+# FORWARD[t][square] is where square lands under symmetry t, INVERSE undoes it
+FORWARD = np.array([[8 * t(r, c)[0] + t(r, c)[1] for r in range(8) for c in range(8)]
+                    for t in _SYMMETRIES], dtype=np.int64)
+INVERSE = np.argsort(FORWARD, axis=1)
+
+NO_MOVE = 64
+
+
+def canonical(board: Board, turn: int) -> tuple:
+    """(key, symmetry) of the smallest Zobrist key over the board's eight symmetries"""
+    flat = board.board.reshape(64)
+    best = None
+    for t in range(len(FORWARD)):
+        cells = np.empty(64, dtype=flat.dtype)
+        cells[FORWARD[t]] = flat
+        key = cellsKey(cells.reshape(8, 8), turn)
+        if best is None or key < best[0]:
+            best = (key, t)
+    return best
+
+
+class PositionCache:
+    """On-disk search results (depth, score, best move) shared across processes and sessions.
+
+    Positions are keyed by their canonical hash so mirrored and rotated
+    positions share an entry. Each row also records the evaluator fingerprint
+    it was searched with (MiniMax.evaluatorKey), and lookups ignore rows from
+    other evaluators, so retuned weights never see stale scores. Each process
+    opens its own SQLite connection in WAL mode; the least recently used rows
+    are evicted past maxEntries.
+    """
+
+    def __init__(self, path, maxEntries=1_000_000, minDepth=3, timeout=30.0):
+        self.path = path
+        self.maxEntries = maxEntries
+        self.minDepth = minDepth      # shallower results are cheaper to search than to store
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._conn = None
+        self._pid = None
+        self._writes = 0
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_conn"] = None
+        state["_pid"] = None
+        return state
+
+    def connection(self) -> sqlite3.Connection:
+        # connections must not cross a fork
+        if self._conn is None or self._pid != os.getpid():
+            self._conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            columns = [row[1] for row in self._conn.execute("PRAGMA table_info(positions)")]
+            if columns and "evaluator" not in columns:
+                # written before rows carried an evaluator, nothing in it can be trusted
+                self._conn.execute("DROP TABLE positions")
+            self._conn.execute("""CREATE TABLE IF NOT EXISTS positions (
+                                    key INTEGER PRIMARY KEY,
+                                    evaluator TEXT NOT NULL,
+                                    depth INTEGER NOT NULL,
+                                    score REAL NOT NULL,
+                                    move INTEGER NOT NULL,
+                                    used REAL NOT NULL)""")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS positions_used ON positions(used)")
+            self._pid = os.getpid()
+        return self._conn
+
+    @staticmethod
+    def _signed(key: int) -> int:
+        # SQLite integers are signed 64-bit
+        return key - (1 << 64) if key >= (1 << 63) else key
+
+    def lookup(self, board: Board, turn: int, depth: int, evaluator: str = ""):
+        """(score, move) for the side to move if stored at least this deep by the same evaluator, else None"""
+        key, t = canonical(board, turn)
+        conn = self.connection()
+        row = conn.execute("SELECT depth, score, move FROM positions WHERE key = ? AND evaluator = ?",
+                           (self._signed(key), evaluator)).fetchone()
+        if row is None or row[0] < depth:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        conn.execute("UPDATE positions SET used = ? WHERE key = ?", (time.time(), self._signed(key)))
+        move = None if row[2] == NO_MOVE else divmod(int(INVERSE[t][row[2]]), 8)
+        return row[1], move
+
+    def store(self, board: Board, turn: int, depth: int, score: float, move, evaluator: str = ""):
+        if depth < self.minDepth:
+            return
+        key, t = canonical(board, turn)
+        code = NO_MOVE if move is None else int(FORWARD[t][move[0] * 8 + move[1]])
+
+        # a different evaluator replaces the row whatever its depth
+        conn = self.connection()
+        conn.execute("""INSERT INTO positions (key, evaluator, depth, score, move, used) VALUES (?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(key) DO UPDATE SET
+                            evaluator = excluded.evaluator, depth = excluded.depth, score = excluded.score,
+                            move = excluded.move, used = excluded.used
+                        WHERE excluded.depth >= positions.depth OR excluded.evaluator != positions.evaluator""",
+                     (self._signed(key), evaluator, depth, float(score), code, time.time()))
+
+        self._writes += 1
+        if self._writes % 256 == 0:
+            self.evict()
+
+    def evict(self):
+        conn = self.connection()
+        count = conn.execute("SELECT COUNT(*) FROM positions").fetchone()[0]
+        if count > self.maxEntries:
+            conn.execute("""DELETE FROM positions WHERE key IN
+                            (SELECT key FROM positions ORDER BY used LIMIT ?)""",
+                         (count - self.maxEntries,))
+
+    def close(self):
+        if self._conn is not None and self._pid == os.getpid():
+            self._conn.close()
+        self._conn = None
@@ -0,0 +1,190 @@
+import math
+import multiprocessing
+import random
+import time
+
+import numpy as np
+from Logic.Board import Board
+
+CORNERS = {(0, 0), (0, 7), (7, 0), (7, 7)}
+
+
+class Node:
+    __slots__ = ("move", "player", "parent", "children", "untried", "visits", "wins")
+
+    def __init__(self, move, player, parent, untried):
+        self.move = move          # move that led here, None at the root or after a pass
+        self.player = player      # who played that move, wins are counted for them
+        self.parent = parent
+        self.children = []
+        self.untried = untried
+        self.visits = 0
+        self.wins = 0.0
+
+    def uct(self, c: float) -> float:
+        return self.wins / self.visits + c * math.sqrt(math.log(self.parent.visits) / self.visits)
+
+    def stats(self, depth: int) -> dict:
+        """Visit/win counts of the subtree down to depth, keyed by move, for merging"""
+        children = {}
+        if depth > 0:
+            for child in self.children:
+                children[child.move] = child.stats(depth - 1)
+        return {"visits": self.visits, "wins": self.wins, "children": children}
+
+
+def mergeStats(trees: list) -> dict:
+    merged = {"visits": 0, "wins": 0.0, "children": {}}
+    grouped = {}
+    for tree in trees:
+        merged["visits"] += tree["visits"]
+        merged["wins"] += tree["wins"]
+        for move, child in tree["children"].items():
+            grouped.setdefault(move, []).append(child)
+    for move, children in grouped.items():
+        merged["children"][move] = mergeStats(children)
+    return merged
+
+
+class MCTS:
+    """UCT search with random or lightly guided playouts, run across worker processes"""
+
+    def __init__(self, playouts=400, timeLimit=None, workers=1, exploration=1.4,
+                 guided=True, mergeDepth=2, seed=None):
+        self.playouts = playouts
+        self.timeLimit = timeLimit      # seconds per move, overrides the playout budget
+        self.workers = workers
+        self.exploration = exploration
+        self.guided = guided            # corner-first playouts instead of uniform random ones
+        self.mergeDepth = mergeDepth
+        self.seed = seed
+        self.nodes = 0                  # playouts run for the last decision
+        self.lastScore = None
+        self.tree = None
+        self._pool = None
+        self._searches = 0
+
+    def decision(self, board: Board, turn: int) -> tuple:
+        moves = board.findAllPossibleMoves(turn)
+        if not moves:
+            return
+        if len(moves) == 1:
+            self.nodes = 0
+            return next(iter(moves))
+
+        self._searches += 1
+        base = self.seed if self.seed is not None else random.randrange(1 << 30)
+        seeds = [base + self._searches * 1000 + i for i in range(self.workers)]
+        budget = math.ceil(self.playouts / self.workers)
+        jobs = [(board, turn, budget, self.timeLimit, self.exploration, self.guided, self.mergeDepth, s)
+                for s in seeds]
+
+        if self.workers > 1:
+            if self._pool is None:
+                self._pool = multiprocessing.Pool(self.workers)
+            trees = self._pool.map(_searchWorker, jobs)
+        else:
+            trees = [_searchWorker(job) for job in jobs]
+
+        self.tree = mergeStats(trees)
+        self.nodes = self.tree["visits"]
+
+        # most visited child is the most robust choice after merging
+        move, child = max(sorted(self.tree["children"].items()), key=lambda item: item[1]["visits"])
+        self.lastScore = child["wins"] / child["visits"]
+        return move
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+
+def _searchWorker(job) -> dict:
+    board, turn, playouts, timeLimit, exploration, guided, mergeDepth, seed = job
+    rng = random.Random(seed)
+    root = Node(None, -turn, None, sorted(board.findAllPossibleMoves(turn)))
+    deadline = time.perf_counter() + timeLimit if timeLimit is not None else None
+
+    done = 0
+    while (done < playouts) if deadline is None else (time.perf_counter() < deadline):
+        _iterate(root, board, exploration, guided, rng)
+        done += 1
+
+    return root.stats(mergeDepth)
+
+
+def _copyBoard(board: Board) -> Board:
+    new_board = Board()
+    new_board.board = np.copy(board.board)
+    new_board.black_disc_count = board.black_disc_count
+    new_board.white_disc_count = board.white_disc_count
+    return new_board
+
+
+def _play(board: Board, move: tuple, turn: int):
+    row, col = move
+    board.board[row, col] = turn
+    board.setDiscs(row, col, turn)
+
+
+def _iterate(root: Node, board: Board, exploration: float, guided: bool, rng: random.Random):
+    node = root
+    board = _copyBoard(board)
+
+    # selection
+    while not node.untried and node.children:
+        node = max(node.children, key=lambda child: child.uct(exploration))
+        if node.move is not None:
+            _play(board, node.move, node.player)
+
+    # expansion, a pass is a child with no move
+    turn = -node.player
+    if node.untried:
+        move = node.untried.pop(rng.randrange(len(node.untried)))
+        _play(board, move, turn)
+        child = Node(move, turn, node, sorted(board.findAllPossibleMoves(-turn)))
+        node.children.append(child)
+        node = child
+    elif not node.children and board.findAllPossibleMoves(-turn):
+        child = Node(None, turn, node, sorted(board.findAllPossibleMoves(-turn)))
+        node.children.append(child)
+        node = child
+
+    # simulation
+    winner = _playout(board, -node.player, guided, rng)
+
+    # backpropagation
+    while node is not None:
+        node.visits += 1
+        if winner == node.player:
+            node.wins += 1
+        elif winner == Board.EMPTY:
+            node.wins += 0.5
+        node = node.parent
+
+
+def _playout(board: Board, turn: int, guided: bool, rng: random.Random) -> int:
+    passed = False
+    while True:
+        moves = board.findAllPossibleMoves(turn)
+        if not moves:
+            if passed:
+                break
+            passed = True
+            turn = -turn
+            continue
+        passed = False
+
+        moves = sorted(moves)
+        corners = [move for move in moves if move in CORNERS] if guided else []
+        _play(board, rng.choice(corners or moves), turn)
+        turn = -turn
+
+    balance = int(np.sum(board.board))
+    if balance > 0:
+        return Board.BLACK
+    if balance < 0:
+        return Board.WHITE
+    return Board.EMPTY
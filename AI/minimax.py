@@ -1,5 +1,12 @@
+import hashlib
+import json
+import os
+import time
+
 import numpy as np
 from Logic.Board import Board
+from AI.mcts import MCTS
+from AI.transposition import TranspositionTable, positionKey, EXACT, LOWER, UPPER
 
 class OthelloAI:
     """AI player using Minimax algorithm for Othello"""
@@ -145,17 +152,30 @@ class OthelloAI:
 
 class AIController:
     
-    def __init__(self, depth):
-        
-        self.ai = MiniMax(depth)
+    def __init__(self, depth, engine="minimax", **options):
+        
+        # "minimax" takes MiniMax options, "mcts" takes MCTS options (playouts, timeLimit, workers...)
+        if engine == "mcts":
+            self.ai = MCTS(**options)
+            self.decide = self.ai.decision
+        elif engine == "minimax":
+            self.ai = MiniMax(depth, **options)
+            self.decide = self.ai.minimaxDecision
+        else:
+            raise ValueError(f"unknown engine {engine!r}")
         self.thinking = False
         self.move_ready = False
         self.next_move = None
+        self.last_time = 0.0    # seconds spent on the last move
+        self.last_nodes = 0
     
     def compute_move(self, board: Board, player: int):
         
         self.thinking = True
-        self.next_move = self.ai.minimaxDecision(board, player)
+        start = time.perf_counter()
+        self.next_move = self.decide(board, player)
+        self.last_time = time.perf_counter() - start
+        self.last_nodes = self.ai.nodes
         self.move_ready = True
         self.thinking = False
     
@@ -175,11 +195,89 @@ class AIController:
 
 
 
+CORNERS = [(0, 0), (0, 7), (7, 0), (7, 7)]
+EDGES = sorted({(0, i) for i in range(8)} | {(7, i) for i in range(8)}
+               | {(i, 0) for i in range(8)} | {(i, 7) for i in range(8)})
+DANGEROUS_POSITIONS = [
+    (0, 1), (1, 0), (1, 1),  # Near top-left corner
+    (0, 6), (1, 6), (1, 7),  # Near top-right corner
+    (6, 0), (6, 1), (7, 1),  # Near bottom-left corner
+    (6, 6), (6, 7), (7, 6)   # Near bottom-right corner
+]
+
+FEATURES = ("disc", "mobility", "corner", "edge", "danger")
+DEFAULT_WEIGHTS = {
+    "disc": 10,          # Disc count
+    "mobility": 15,      # Mobility is important
+    "corner": 25,        # Corners are crucial
+    "edge": 5,           # Edges are valuable
+    "danger": -10,       # Avoid dangerous positions
+}
+# Tuned weights (see AI/tuning.py) are picked up from here unless OTHELLO_WEIGHTS points elsewhere
+WEIGHTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "weights.json")
+
+
+def loadWeights(path=None) -> dict:
+    """DEFAULT_WEIGHTS overridden by a JSON file of {feature: weight}, when there is one"""
+    path = path or os.environ.get("OTHELLO_WEIGHTS", WEIGHTS_PATH)
+    weights = dict(DEFAULT_WEIGHTS)
+    if os.path.exists(path):
+        with open(path) as f:
+            loaded = json.load(f)
+        unknown = set(loaded) - set(FEATURES)
+        if unknown:
+            raise ValueError(f"unknown evaluation features in {path}: {sorted(unknown)}")
+        weights.update(loaded)
+    return weights
+
+
+class SearchAborted(Exception):
+    """Raised inside a search when its limits run out, the last finished iteration is used"""
+
+
 class MiniMax:
-    def __init__(self, depth):
+    DRIVERS = ("minimax", "pvs", "mtdf")
+    ASPIRATION = 50  # half width of the aspiration window around the last score
+
+    def __init__(self, depth, probcut=None, driver="minimax", tt=None, cache=None, weights=None,
+                 timeLimit=None, tracer=None, nodeBudget=None):
+        if driver not in self.DRIVERS:
+            raise ValueError(f"unknown search driver {driver!r}, expected one of {self.DRIVERS}")
+        if (timeLimit is not None or nodeBudget is not None) and driver == "minimax":
+            raise ValueError("time limits and node budgets need an iterative deepening driver ('pvs' or 'mtdf')")
+        if nodeBudget is not None and cache is not None:
+            raise ValueError("a node budget search must not depend on a shared position cache")
+        if nodeBudget is not None and tt is not None:
+            # the table is cleared before every move, which would also wipe one shared with other searches
+            raise ValueError("a node budget search keeps its own transposition table, do not pass tt")
         self.depth = depth
+        # optional ProbCut parameters (see AI/probcut.py) for forward pruning
+        self.probcut = probcut
+        self.driver = driver
+        self.tt = tt if tt is not None else TranspositionTable()
+        # optional PositionCache (see AI/cache.py) consulted before searching the root
+        self.cache = cache
+        self.weights = loadWeights() if weights is None else {**DEFAULT_WEIGHTS, **weights}
+        # seconds per move; depth then only caps the iterative deepening
+        self.timeLimit = timeLimit
+        # nodes per move; each decision starts from an empty transposition table so
+        # the move depends only on the position and the budget
+        self.nodeBudget = nodeBudget
+        # optional SearchTracer (see AI/trace.py), searches only check it against None when unset
+        self.tracer = tracer
+        # optional threading.Event; once set, the running search raises SearchAborted at its next node
+        self.cancel = None
+        self.deadline = None
+        self.nodes = 0
+        self.lastScore = None
+        self.completedDepth = 0   # plies from the root of the last finished iteration
 
     def heuristic(self, board: Board, player: int) -> float:
+        features = self.features(board, player)
+        return sum(self.weights[name] * value for name, value in zip(FEATURES, features))
+
+    def features(self, board: Board, player: int) -> tuple:
+        """Unweighted evaluation terms for player, in the order of FEATURES"""
         opponent = -player
         
         # 1. Disc count difference (basic score)
@@ -193,54 +291,40 @@ class MiniMax:
         mobility = player_moves - opponent_moves
         
         # 3. Corner control (corners are crucial in Othello)
-        corners = [(0, 0), (0, 7), (7, 0), (7, 7)]
-        corner_score = 0
-        for r, c in corners:
+        corner_diff = 0
+        for r, c in CORNERS:
             if board.board[r, c] == player:
-                corner_score += 25
+                corner_diff += 1
             elif board.board[r, c] == opponent:
-                corner_score -= 25
+                corner_diff -= 1
         
         # 4. Edge control
-        edge_score = 0
-        edges = []
-        for i in range(8):
-            edges.extend([(0, i), (7, i), (i, 0), (i, 7)])
-        edges = list(set(edges))  # Remove duplicates
-        
-        for r, c in edges:
+        edge_diff = 0
+        for r, c in EDGES:
             if board.board[r, c] == player:
-                edge_score += 5
+                edge_diff += 1
             elif board.board[r, c] == opponent:
-                edge_score -= 5
-        
-        # 5. Stability - penalize positions next to corners (X-squares and C-squares)
-        stability_penalty = 0
-        dangerous_positions = [
-            (0, 1), (1, 0), (1, 1),  # Near top-left corner
-            (0, 6), (1, 6), (1, 7),  # Near top-right corner
-            (6, 0), (6, 1), (7, 1),  # Near bottom-left corner
-            (6, 6), (6, 7), (7, 6)   # Near bottom-right corner
-        ]
+                edge_diff -= 1
         
-        for r, c in dangerous_positions:
+        # 5. Stability - positions next to corners (X-squares and C-squares)
+        danger_diff = 0
+        for r, c in DANGEROUS_POSITIONS:
             if board.board[r, c] == player:
-                stability_penalty -= 10
+                danger_diff += 1
             elif board.board[r, c] == opponent:
-                stability_penalty += 10
-        
-        # Weighted combination of factors
-        total_score = (
-            disc_diff * 10 +           # Disc count
-            mobility * 15 +             # Mobility is important
-            corner_score +              # Corners are crucial
-            edge_score +                # Edges are valuable
-            stability_penalty           # Avoid dangerous positions
-        )
+                danger_diff -= 1
         
-        return total_score
+        return disc_diff, mobility, corner_diff, edge_diff, danger_diff
         
     
+    def evaluatorKey(self) -> str:
+        """Fingerprint of the weights and ProbCut parameters, cached results are only valid for the same one"""
+        data = {"weights": self.weights}
+        if self.probcut is not None:
+            data["probcut"] = [self.probcut.threshold, self.probcut.stageSize,
+                               sorted((stage, sorted(depths.items())) for stage, depths in self.probcut.cuts.items())]
+        return hashlib.sha1(json.dumps(data, sort_keys=True).encode()).hexdigest()[:16]
+
     def copy_board(self, board: Board) -> Board:
 
         new_board = Board()
@@ -249,7 +333,42 @@ class MiniMax:
         new_board.white_disc_count = board.white_disc_count
         return new_board
     
+    def play(self, board: Board, move: tuple, turn: int) -> Board:
+        temp = self.copy_board(board)
+        row, col = move
+        temp.board[row, col] = turn
+        temp.setDiscs(row, col, turn)
+        return temp
+
     def minimaxDecision (self, board: Board, turn: int) -> tuple:
+        self.nodes = 0
+        self.completedDepth = 0
+        self.deadline = time.perf_counter() + self.timeLimit if self.timeLimit is not None else None
+        if self.tracer is not None:
+            # an aborted search leaves its move path behind
+            self.tracer.path.clear()
+        if self.nodeBudget is not None:
+            self.tt.clear()
+        plies = self.depth + 1
+        if self.cache is not None:
+            evaluator = self.evaluatorKey()
+            hit = self.cache.lookup(board, turn, plies, evaluator)
+            if hit is not None and hit[1] in board.findAllPossibleMoves(turn):
+                self.lastScore, move = hit
+                return move
+
+        if self.driver == "pvs":
+            move = self.pvsDecision(board, turn)
+        elif self.driver == "mtdf":
+            move = self.mtdfDecision(board, turn)
+        else:
+            move = self.minimaxRoot(board, turn)
+
+        if self.cache is not None and move is not None:
+            self.cache.store(board, turn, self.completedDepth, self.lastScore, move, evaluator)
+        return move
+
+    def minimaxRoot(self, board: Board, turn: int) -> tuple:
         moves = board.findAllPossibleMoves(turn)
         
         if(turn == board.BLACK):
@@ -268,17 +387,32 @@ class MiniMax:
                 temp.board[row, col] = turn
                 temp.setDiscs(row, col, turn)
 
-                val = self.minimaxValue(temp, turn, opp, self.depth, float('-inf'), float('inf'))
+                if self.tracer is not None:
+                    self.tracer.push(move)
+                # only moves that beat the best so far matter, which gives the subtree an alpha to cut against
+                val = self.minimaxValue(temp, turn, opp, self.depth, bestMoveVal, float('inf'))
+                if self.tracer is not None:
+                    self.tracer.pop()
 
                 if (val > bestMoveVal):
                     bestMoveVal = val
                     bestMove = move
 
+            self.lastScore = bestMoveVal
+            self.completedDepth = self.depth + 1
             return bestMove
 
     def minimaxValue(self, board:Board, originalTurn:int, currentTurn:int, depth:int, alpha:int, beta:int):
+        self.nodes += 1
+        tracer = self.tracer
+        if tracer is not None:
+            window = alpha, beta
+
         if (depth == 0 or board.isGameOver()):
-            return self.heuristic(board, originalTurn)
+            val = self.heuristic(board, originalTurn)
+            if tracer is not None:
+                tracer.record(depth, *window, val, "leaf")
+            return val
 
         if(currentTurn == board.BLACK):
             opp = board.WHITE
@@ -289,7 +423,20 @@ class MiniMax:
         moves = board.findAllPossibleMoves(currentTurn)
 
         if(not moves):
-            return self.minimaxValue(board, originalTurn, opp, depth -1, alpha, beta)
+            if tracer is not None:
+                tracer.push(None)
+            val = self.minimaxValue(board, originalTurn, opp, depth -1, alpha, beta)
+            if tracer is not None:
+                tracer.pop()
+                tracer.record(depth, *window, val, "pass")
+            return val
+
+        if self.probcut is not None:
+            cut = self.probCut(board, originalTurn, currentTurn, depth, alpha, beta)
+            if cut is not None:
+                if tracer is not None:
+                    tracer.record(depth, *window, cut, "probcut")
+                return cut
         
         if(originalTurn == currentTurn):
             bestMoveVal = float('-inf')
@@ -300,12 +447,18 @@ class MiniMax:
                 temp.board[row, col] = currentTurn
                 temp.setDiscs(row, col, currentTurn)
                 
+                if tracer is not None:
+                    tracer.push(move)
                 val = self.minimaxValue(temp, originalTurn, opp, depth -1, alpha, beta)
+                if tracer is not None:
+                    tracer.pop()
 
                 bestMoveVal = max(bestMoveVal, val)
                 alpha = max(alpha, bestMoveVal)
                 if beta <= alpha:
                     break
+            if tracer is not None:
+                tracer.record(depth, *window, bestMoveVal, "cutoff" if beta <= alpha else "all")
             return bestMoveVal
         else:
             bestMoveVal = float('inf')
@@ -316,13 +469,254 @@ class MiniMax:
                 temp.board[row, col] = currentTurn
                 temp.setDiscs(row, col, currentTurn)
                 
+                if tracer is not None:
+                    tracer.push(move)
                 val = self.minimaxValue(temp, originalTurn, opp, depth -1, alpha, beta)
+                if tracer is not None:
+                    tracer.pop()
 
                 bestMoveVal = min(bestMoveVal, val)
-                beta = min(alpha, bestMoveVal)
+                beta = min(beta, bestMoveVal)
                 if beta <= alpha:
                     break
+            if tracer is not None:
+                tracer.record(depth, *window, bestMoveVal, "cutoff" if beta <= alpha else "all")
             return bestMoveVal
-    
-        
 
+    def probCut(self, board: Board, originalTurn: int, currentTurn: int, depth: int, alpha, beta):
+        # Cuts are fitted from the side to move, scores here are from originalTurn
+        sign = 1 if currentTurn == originalTurn else -1
+        margin_scale = self.probcut.threshold
+
+        for shallow, a, b, sigma in self.probcut.cutsFor(board, depth):
+            margin = margin_scale * sigma
+
+            if beta != float('inf'):
+                bound = (beta + margin - sign * b) / a
+                if self.minimaxValue(board, originalTurn, currentTurn, shallow, bound - 1, bound) >= bound:
+                    return beta
+
+            if alpha != float('-inf'):
+                bound = (alpha - margin - sign * b) / a
+                if self.minimaxValue(board, originalTurn, currentTurn, shallow, bound, bound + 1) <= bound:
+                    return alpha
+        return None
+
+    # The minimax driver searches depth plies below each root move, so the
+    # negamax drivers search depth + 1 plies from the root to match it.
+
+    def orderMoves(self, moves, first=None) -> list:
+        ordered = sorted(moves)
+        if first in moves:
+            ordered.remove(first)
+            ordered.insert(0, first)
+        return ordered
+
+    def negamax(self, board: Board, turn: int, depth: int, alpha, beta):
+        """Principal variation search scored for turn, backed by the transposition table"""
+        self.nodes += 1
+        self.checkLimits()
+        alphaOrig = alpha
+        tracer = self.tracer
+
+        key = positionKey(board, turn)
+        ttMove = None
+        entry = self.tt.probe(key)
+        if entry is not None:
+            entryDepth, flag, score, ttMove = entry
+            if entryDepth >= depth and (flag == EXACT
+                                        or (flag == LOWER and score >= beta)
+                                        or (flag == UPPER and score <= alpha)):
+                if tracer is not None:
+                    tracer.record(depth, alpha, beta, score, "tt")
+                return score
+
+        if depth == 0 or board.isGameOver():
+            val = self.heuristic(board, turn)
+            if tracer is not None:
+                tracer.record(depth, alpha, beta, val, "leaf")
+            return val
+
+        moves = board.findAllPossibleMoves(turn)
+        if not moves:
+            if tracer is not None:
+                tracer.push(None)
+            val = -self.negamax(board, -turn, depth - 1, -beta, -alpha)
+            if tracer is not None:
+                tracer.pop()
+                tracer.record(depth, alpha, beta, val, "pass")
+            return val
+
+        if self.probcut is not None:
+            cut = self.probCut(board, turn, turn, depth, alpha, beta)
+            if cut is not None:
+                if tracer is not None:
+                    tracer.record(depth, alpha, beta, cut, "probcut")
+                return cut
+
+        bestMoveVal = float('-inf')
+        bestMove = None
+        for i, move in enumerate(self.orderMoves(moves, ttMove)):
+            temp = self.play(board, move, turn)
+            if tracer is not None:
+                tracer.push(move)
+            if i == 0:
+                val = -self.negamax(temp, -turn, depth - 1, -beta, -alpha)
+            else:
+                val = -self.negamax(temp, -turn, depth - 1, -alpha - 1, -alpha)
+                if alpha < val < beta:
+                    val = -self.negamax(temp, -turn, depth - 1, -beta, -val)
+            if tracer is not None:
+                tracer.pop()
+
+            if val > bestMoveVal:
+                bestMoveVal = val
+                bestMove = move
+            alpha = max(alpha, val)
+            if alpha >= beta:
+                break
+
+        if tracer is not None:
+            tracer.record(depth, alphaOrig, beta, bestMoveVal, "cutoff" if alpha >= beta else "all")
+        if bestMoveVal <= alphaOrig:
+            flag = UPPER
+        elif bestMoveVal >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.tt.store(key, depth, flag, bestMoveVal, bestMove)
+        return bestMoveVal
+
+    def checkLimits(self):
+        if self.cancel is not None and self.cancel.is_set():
+            raise SearchAborted()
+        # the first iteration always finishes so there is a move to fall back on
+        if self.completedDepth == 0:
+            return
+        if self.nodeBudget is not None and self.nodes > self.nodeBudget:
+            raise SearchAborted()
+        if self.deadline is not None and self.nodes % 64 == 0 and time.perf_counter() >= self.deadline:
+            raise SearchAborted()
+
+    def searchRoot(self, board: Board, turn: int, depth: int, alpha, beta, firstMove=None):
+        """Same as negamax, but returns the best root move along with its score"""
+        self.nodes += 1
+        bestMoveVal = float('-inf')
+        bestMove = None
+
+        for i, move in enumerate(self.orderMoves(board.findAllPossibleMoves(turn), firstMove)):
+            temp = self.play(board, move, turn)
+            if self.tracer is not None:
+                self.tracer.push(move)
+            if i == 0:
+                val = -self.negamax(temp, -turn, depth - 1, -beta, -alpha)
+            else:
+                val = -self.negamax(temp, -turn, depth - 1, -alpha - 1, -alpha)
+                if alpha < val < beta:
+                    val = -self.negamax(temp, -turn, depth - 1, -beta, -val)
+            if self.tracer is not None:
+                self.tracer.pop()
+
+            if val > bestMoveVal:
+                bestMoveVal = val
+                bestMove = move
+            alpha = max(alpha, val)
+            if alpha >= beta:
+                break
+
+        return bestMoveVal, bestMove
+
+    def pvsDecision(self, board: Board, turn: int) -> tuple:
+        """Iterative deepening PVS with aspiration windows around the previous score"""
+        if not board.findAllPossibleMoves(turn):
+            return
+
+        score, bestMove = None, None
+        try:
+            for depth in range(1, self.depth + 2):
+                if score is None:
+                    score, bestMove = self.searchRoot(board, turn, depth, float('-inf'), float('inf'), bestMove)
+                    self.completedDepth = depth
+                    continue
+
+                alpha, beta = score - self.ASPIRATION, score + self.ASPIRATION
+                val, move = self.searchRoot(board, turn, depth, alpha, beta, bestMove)
+                if val <= alpha or val >= beta:
+                    val, move = self.searchRoot(board, turn, depth, float('-inf'), float('inf'), bestMove)
+                score, bestMove = val, move
+                self.completedDepth = depth
+        except SearchAborted:
+            pass
+
+        self.lastScore = score
+        return bestMove
+
+    def mtdfDecision(self, board: Board, turn: int) -> tuple:
+        """Iterative deepening MTD(f): repeated null-window searches over the transposition table"""
+        if not board.findAllPossibleMoves(turn):
+            return
+
+        guess, bestMove = 0, None
+        try:
+            for depth in range(1, self.depth + 2):
+                guess, bestMove = self.mtdf(board, turn, depth, guess, bestMove)
+                self.completedDepth = depth
+        except SearchAborted:
+            pass
+
+        self.lastScore = guess
+        return bestMove
+
+    def mtdf(self, board: Board, turn: int, depth: int, guess, firstMove=None):
+        g = guess
+        bestMove = firstMove
+        lower, upper = float('-inf'), float('inf')
+
+        while lower < upper:
+            beta = g + 1 if g == lower else g
+            g, move = self.searchRoot(board, turn, depth, beta - 1, beta, bestMove)
+            if g < beta:
+                upper = g
+            else:
+                # only a fail high proves the move reaches the bound
+                lower = g
+                bestMove = move
+
+        return g, bestMove
+
+    def multiPV(self, board: Board, turn: int, k=None, depth=None) -> list:
+        """Exact scores of the best k root moves (all moves when k is None), best first.
+
+        Root moves share the transposition table, and once k scores are known
+        the remaining moves are searched against the k-th best score, so only
+        moves that beat it get searched exactly.
+        """
+        depth = (self.depth if depth is None else depth) + 1
+        moves = board.findAllPossibleMoves(turn)
+        if not moves:
+            return []
+
+        entry = self.tt.probe(positionKey(board, turn))
+        scored = []
+        for move in self.orderMoves(moves, entry[3] if entry is not None else None):
+            temp = self.play(board, move, turn)
+            if k is None or len(scored) < k:
+                scored.append((-self.negamax(temp, -turn, depth - 1, float('-inf'), float('inf')), move))
+                scored.sort(key=lambda item: -item[0])
+                continue
+
+            kth = scored[k - 1][0]
+            val = -self.negamax(temp, -turn, depth - 1, float('-inf'), -kth)
+            if val > kth:
+                scored.insert(k - 1, (val, move))
+                scored.sort(key=lambda item: -item[0])
+                scored.pop()
+
+        if scored:
+            self.tt.store(positionKey(board, turn), depth, EXACT, scored[0][0], scored[0][1])
+        return [(move, score) for score, move in scored]
+
+    def multiPVIterative(self, board: Board, turn: int, k=None):
+        """Yield (depth, multiPV results) for every depth up to self.depth, shallowest first"""
+        for depth in range(0, self.depth + 1):
+            yield depth, self.multiPV(board, turn, k, depth)
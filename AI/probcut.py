@@ -0,0 +1,147 @@
+import json
+import random
+import sys
+from statistics import NormalDist
+
+import numpy as np
+from Logic.Board import Board
+
+
+class ProbCut:
+    """Multi-ProbCut parameters for MiniMax forward pruning.
+
+    For a game stage and a deep search depth, each cut is a regression
+    ``deep ~ a * shallow + b`` with residual deviation ``sigma``, fitted from
+    values seen by the side to move.
+    """
+
+    def __init__(self, cuts=None, stageSize=16, confidence=0.9):
+        # {stage: {depth: [(shallowDepth, a, b, sigma), ...]}}
+        self.cuts = cuts or {}
+        self.stageSize = stageSize
+        self.setConfidence(confidence)
+
+    def setConfidence(self, confidence: float):
+        # probability that a pruned move would not have changed the result
+        self.confidence = confidence
+        self.threshold = NormalDist().inv_cdf(confidence)
+
+    def stage(self, board: Board) -> int:
+        return (int(np.count_nonzero(board.board)) - 4) // self.stageSize
+
+    def cutsFor(self, board: Board, depth: int) -> list:
+        return self.cuts.get(self.stage(board), {}).get(depth, [])
+
+    @classmethod
+    def load(cls, path, confidence=None):
+        with open(path) as f:
+            data = json.load(f)
+
+        cuts = {}
+        for stage, depths in data["cuts"].items():
+            cuts[int(stage)] = {int(depth): [tuple(cut) for cut in pairs]
+                                for depth, pairs in depths.items()}
+
+        if confidence is None:
+            confidence = data.get("confidence", 0.9)
+        return cls(cuts, data.get("stageSize", 16), confidence)
+
+    def save(self, path):
+        data = {
+            "confidence": self.confidence,
+            "stageSize": self.stageSize,
+            "cuts": {str(stage): {str(depth): [list(cut) for cut in pairs]
+                                  for depth, pairs in depths.items()}
+                     for stage, depths in self.cuts.items()},
+        }
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+
+
+def samplePositions(games: int, seed: int = 0) -> list:
+    """Play random self-play games and keep every position with its side to move"""
+    from AI.minimax import MiniMax
+
+    rng = random.Random(seed)
+    helper = MiniMax(0)
+    positions = []
+
+    for _ in range(games):
+        board = Board()
+        turn = Board.BLACK
+        while not board.isGameOver():
+            moves = sorted(board.findAllPossibleMoves(turn))
+            if not moves:
+                turn = -turn
+                continue
+            positions.append((helper.copy_board(board), turn))
+            row, col = rng.choice(moves)
+            board.board[row, col] = turn
+            board.setDiscs(row, col, turn)
+            turn = -turn
+
+    return positions
+
+
+def fitProbCut(positions: list, pairs: list, stageSize: int = 16, confidence: float = 0.9) -> ProbCut:
+    """Fit a (shallow, deep) regression for every game stage from sampled positions"""
+    from AI.minimax import MiniMax
+
+    searcher = MiniMax(0)
+    cuts = ProbCut(stageSize=stageSize, confidence=confidence)
+    samples = {}
+
+    for board, turn in positions:
+        stage = cuts.stage(board)
+        for shallow, deep in pairs:
+            v_shallow = searcher.minimaxValue(board, turn, turn, shallow, float('-inf'), float('inf'))
+            v_deep = searcher.minimaxValue(board, turn, turn, deep, float('-inf'), float('inf'))
+            samples.setdefault((stage, shallow, deep), []).append((v_shallow, v_deep))
+
+    for (stage, shallow, deep), values in samples.items():
+        if len(values) < 3:
+            continue
+        x, y = np.array(values, dtype=np.float64).T
+        if np.ptp(x) == 0:
+            continue
+        a, b = np.polyfit(x, y, 1)
+        if a <= 0:
+            continue
+        sigma = float(np.std(y - (a * x + b)))
+        cuts.cuts.setdefault(stage, {}).setdefault(deep, []).append(
+            (shallow, float(a), float(b), sigma))
+
+    return cuts
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Fit Multi-ProbCut parameters from random self-play")
+    parser.add_argument("output", help="JSON file to write the cut parameters to")
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    # the defaults cover the depths MiniMax(2) and MiniMax(3) search below a root move; a 0:1
+    # cut at depth 1 costs more evaluations than it saves, so depth 1 is left unpruned
+    parser.add_argument("--pairs", default="1:2,1:3",
+                        help="comma separated shallow:deep depth pairs, e.g. 1:3,2:4")
+    parser.add_argument("--stage-size", type=int, default=16)
+    parser.add_argument("--confidence", type=float, default=0.9)
+    args = parser.parse_args(argv)
+
+    pairs = [tuple(int(d) for d in pair.split(":")) for pair in args.pairs.split(",")]
+    positions = samplePositions(args.games, args.seed)
+    print(f"Sampled {len(positions)} positions", file=sys.stderr)
+
+    cuts = fitProbCut(positions, pairs, args.stage_size, args.confidence)
+    cuts.save(args.output)
+
+    for stage, depths in sorted(cuts.cuts.items()):
+        for depth, pairs in sorted(depths.items()):
+            for shallow, a, b, sigma in pairs:
+                print(f"stage {stage} depth {depth} <- {shallow}: a={a:.3f} b={b:.2f} sigma={sigma:.2f}",
+                      file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import struct
+import sys
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+NO_MOVE = 64
+
+
+def _pack(depth: int, flag: int, score: float, move) -> int:
+    # score as float32 bits | depth << 32 | flag << 40 | move << 42
+    code = NO_MOVE if move is None else move[0] * 8 + move[1]
+    score_bits = struct.unpack("<I", struct.pack("<f", score))[0]
+    return score_bits | (min(depth, 255) << 32) | (flag << 40) | (code << 42)
+
+
+def _unpack(data: int) -> tuple:
+    score = struct.unpack("<f", struct.pack("<I", data & 0xFFFFFFFF))[0]
+    depth = (data >> 32) & 0xFF
+    flag = (data >> 40) & 0x3
+    code = (data >> 42) & 0x7F
+    return depth, flag, score, None if code == NO_MOVE else divmod(code, 8)
+
+
+class SharedTranspositionTable:
+    """Transposition table in shared memory that worker processes read and write without locks.
+
+    Every slot holds (key ^ data, data) as two uint64s. A write torn by a
+    concurrent writer fails the key check on the next probe and reads as a
+    miss, so no lock is needed. Entries are replaced lossily like
+    TranspositionTable: a different position always evicts, the same
+    position keeps its deeper result. Scores are stored as float32.
+
+    Pass the table to workers as an argument: pickling sends only the
+    segment name and the worker maps the same memory.
+    """
+
+    def __init__(self, size=1 << 20, name=None):
+        self.size = size
+        self.owner = name is None
+        if self.owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=size * 16)
+        else:
+            self.shm = _attach(name)
+        self.slots = np.ndarray((size, 2), dtype=np.uint64, buffer=self.shm.buf)
+        if self.owner:
+            self.slots[:] = 0
+        self.probes = 0
+        self.hits = 0
+
+    def __getstate__(self):
+        return {"size": self.size, "name": self.shm.name}
+
+    def __setstate__(self, state):
+        self.__init__(state["size"], state["name"])
+
+    def probe(self, key: int):
+        self.probes += 1
+        check, data = self.slots[key % self.size]
+        data = int(data)
+        if data == 0 or int(check) ^ data != key:
+            return None
+        self.hits += 1
+        return _unpack(data)
+
+    def store(self, key: int, depth: int, flag: int, score: float, move):
+        index = key % self.size
+        check, data = self.slots[index]
+        data = int(data)
+        if data != 0 and int(check) ^ data == key and (data >> 32) & 0xFF > depth:
+            return
+        data = _pack(depth, flag, score, move)
+        self.slots[index, 1] = data
+        self.slots[index, 0] = key ^ data
+
+    def clear(self):
+        self.slots[:] = 0
+        self.probes = 0
+        self.hits = 0
+
+    def close(self):
+        """Detach this process; the owner also frees the segment"""
+        self.slots = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # Before 3.13 attaching registers the segment with the resource tracker,
+    # which would free it when this worker exits while the owner still uses it
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
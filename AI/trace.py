@@ -0,0 +1,67 @@
+import struct
+from collections import deque
+
+# Why a node returned the value it did
+REASONS = ("leaf", "tt", "pass", "probcut", "cutoff", "all")
+
+# file record: path length, path squares (row * 8 + col, PASS for a pass), then depth, reason, alpha, beta, value
+PASS = 64
+_HEADER = struct.Struct("<B")
+_BODY = struct.Struct("<bBfff")
+
+
+class SearchTracer:
+    """Records visited search nodes for MiniMax(tracer=...).
+
+    Nodes go to a ring buffer holding the last capacity records, or, when a
+    path is given, are streamed to that file in a compact binary format that
+    readTrace understands. Scores are for the side to move in the negamax
+    drivers and for the searching player in the minimax driver. A pass
+    appears in a node's path as None.
+    """
+
+    def __init__(self, capacity=100_000, path=None):
+        self.records = deque(maxlen=capacity)
+        self.stream = open(path, "wb") if path else None
+        self.path = []
+
+    def push(self, move):
+        self.path.append(move)
+
+    def pop(self):
+        self.path.pop()
+
+    def record(self, depth: int, alpha, beta, value, reason: str):
+        if self.stream is not None:
+            self.stream.write(_encode(self.path, depth, alpha, beta, value, REASONS.index(reason)))
+        else:
+            self.records.append((tuple(self.path), depth, alpha, beta, value, reason))
+
+    def save(self, path):
+        """Write the ring buffer out in the streaming file format"""
+        with open(path, "wb") as f:
+            for moves, depth, alpha, beta, value, reason in self.records:
+                f.write(_encode(moves, depth, alpha, beta, value, REASONS.index(reason)))
+
+    def close(self):
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+
+
+def _encode(moves, depth, alpha, beta, value, reason) -> bytes:
+    squares = bytes(PASS if move is None else move[0] * 8 + move[1] for move in moves)
+    return _HEADER.pack(len(moves)) + squares + _BODY.pack(depth, reason, alpha, beta, value)
+
+
+def readTrace(path):
+    """Yield (path, depth, alpha, beta, value, reason) records from a trace file"""
+    with open(path, "rb") as f:
+        while True:
+            header = f.read(_HEADER.size)
+            if not header:
+                return
+            moves = tuple(None if square == PASS else divmod(square, 8)
+                          for square in f.read(_HEADER.unpack(header)[0]))
+            depth, reason, alpha, beta, value = _BODY.unpack(f.read(_BODY.size))
+            yield moves, depth, alpha, beta, value, REASONS[reason]
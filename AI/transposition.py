@@ -0,0 +1,56 @@
+import numpy as np
+from Logic.Board import Board
+
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+# Fixed seed so keys agree between processes and between runs
+_rng = np.random.default_rng(0x0DE110)
+ZOBRIST = _rng.integers(0, 2**64, size=(2, 8, 8), dtype=np.uint64)
+ZOBRIST_WHITE_TO_MOVE = int(_rng.integers(0, 2**64, dtype=np.uint64))
+
+
+def positionKey(board: Board, turn: int) -> int:
+    """64-bit Zobrist key of a position with the side to move"""
+    return cellsKey(board.board, turn)
+
+
+def cellsKey(cells: np.ndarray, turn: int) -> int:
+    key = np.bitwise_xor.reduce(ZOBRIST[0][cells == Board.BLACK]) \
+        ^ np.bitwise_xor.reduce(ZOBRIST[1][cells == Board.WHITE])
+    key = int(key)
+    if turn == Board.WHITE:
+        key ^= ZOBRIST_WHITE_TO_MOVE
+    return key
+
+
+class TranspositionTable:
+    """Fixed number of slots indexed by key, newer or deeper entries win"""
+
+    def __init__(self, size=1 << 16):
+        self.size = size
+        self.slots = [None] * size
+        self.probes = 0
+        self.hits = 0
+
+    def probe(self, key: int):
+        self.probes += 1
+        entry = self.slots[key % self.size]
+        if entry is None or entry[0] != key:
+            return None
+        self.hits += 1
+        return entry[1:]
+
+    def store(self, key: int, depth: int, flag: int, score: float, move):
+        index = key % self.size
+        entry = self.slots[index]
+        # keep a deeper result for the same position
+        if entry is not None and entry[0] == key and entry[1] > depth:
+            return
+        self.slots[index] = (key, depth, flag, score, move)
+
+    def clear(self):
+        self.slots = [None] * self.size
+        self.probes = 0
+        self.hits = 0
@@ -0,0 +1,153 @@
+import json
+import multiprocessing
+import random
+import sys
+
+import numpy as np
+from Logic.Board import Board
+from Logic import Record
+from AI.minimax import MiniMax, FEATURES, DEFAULT_WEIGHTS, WEIGHTS_PATH
+
+
+def extractGame(line: str, skip: int = 8) -> list:
+    """(features, outcome) for every position of a recorded game, from the side to move.
+
+    Outcomes are 1 for a win, 0.5 for a draw and 0 for a loss. The first skip
+    plies are left out, they say little about the result.
+    """
+    moves = Record.parseGame(line)
+    helper = MiniMax(0, weights=DEFAULT_WEIGHTS)
+    positions = []
+    for ply, (board, turn) in enumerate(Record.replay(moves)):
+        if turn is None:
+            winner = Record.result(board)
+            break
+        if ply >= skip:
+            positions.append((helper.features(board, turn), turn))
+
+    samples = []
+    for features, turn in positions:
+        outcome = 0.5 if winner == Board.EMPTY else float(winner == turn)
+        samples.append((features, outcome))
+    return samples
+
+
+def extractFeatures(lines: list, workers: int = None, skip: int = 8):
+    """Feature matrix X and outcome vector y of all games, extracted across a process pool"""
+    X, y = [], []
+    with multiprocessing.Pool(workers) as pool:
+        for samples in pool.imap_unordered(_extractWorker, [(line, skip) for line in lines], chunksize=8):
+            for features, outcome in samples:
+                X.append(features)
+                y.append(outcome)
+    return np.array(X, dtype=np.float64).reshape(-1, len(FEATURES)), np.array(y, dtype=np.float64)
+
+
+def _extractWorker(job) -> list:
+    line, skip = job
+    return extractGame(line, skip)
+
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+def error(X: np.ndarray, y: np.ndarray, w: np.ndarray, k: float) -> float:
+    return float(np.mean((y - _sigmoid(k * (X @ w))) ** 2))
+
+
+def fitScale(X: np.ndarray, y: np.ndarray, w: np.ndarray) -> float:
+    """Scale k mapping evaluations to win probability that best fits the current weights"""
+    scales = np.geomspace(1e-4, 1.0, 200)
+    return float(min(scales, key=lambda k: error(X, y, w, k)))
+
+
+def tune(X: np.ndarray, y: np.ndarray, weights: dict, epochs: int = 2000, rate: float = 1.0):
+    """Texel tuning: gradient descent on the squared error of sigmoid(k * X @ w) against y"""
+    w = np.array([weights[name] for name in FEATURES], dtype=np.float64)
+    k = fitScale(X, y, w)
+
+    # descend in units of each feature's spread so one rate suits every weight
+    spread = X.std(axis=0)
+    spread[spread == 0] = 1.0
+    Z = X / spread
+    v = w * spread
+    for _ in range(epochs):
+        p = _sigmoid(k * (Z @ v))
+        grad = (-2.0 * k / len(y)) * (Z.T @ ((y - p) * p * (1 - p)))
+        v -= rate / k * grad
+
+    tuned = v / spread
+    return {name: float(value) for name, value in zip(FEATURES, tuned)}, k
+
+
+def selfplay(games: int, depth: int = 0, epsilon: float = 0.2, seed: int = 0) -> list:
+    """Records of MiniMax self-play games, with random moves mixed in for variety"""
+    rng = random.Random(seed)
+    ai = MiniMax(depth, weights=DEFAULT_WEIGHTS)
+    records = []
+    for _ in range(games):
+        board = Board()
+        turn = Board.BLACK
+        moves = []
+        while not board.isGameOver():
+            legal = sorted(board.findAllPossibleMoves(turn))
+            if not legal:
+                turn = -turn
+                continue
+            move = rng.choice(legal) if rng.random() < epsilon else ai.minimaxDecision(board, turn)
+            board = ai.play(board, move, turn)
+            moves.append(move)
+            turn = -turn
+        records.append(Record.formatGame(moves))
+    return records
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Tune MiniMax evaluation weights from game records")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    play = sub.add_parser("selfplay", help="write self-play game records, one game per line")
+    play.add_argument("output")
+    play.add_argument("--games", type=int, default=100)
+    play.add_argument("--depth", type=int, default=0)
+    play.add_argument("--epsilon", type=float, default=0.2)
+    play.add_argument("--seed", type=int, default=0)
+
+    fit = sub.add_parser("tune", help="fit weights from game record files")
+    fit.add_argument("records", nargs="+")
+    fit.add_argument("--output", default=WEIGHTS_PATH)
+    fit.add_argument("--workers", type=int, default=None)
+    fit.add_argument("--skip", type=int, default=8, help="opening plies to leave out of every game")
+    fit.add_argument("--epochs", type=int, default=2000)
+    fit.add_argument("--rate", type=float, default=1.0)
+    args = parser.parse_args(argv)
+
+    if args.command == "selfplay":
+        with open(args.output, "w") as f:
+            for record in selfplay(args.games, args.depth, args.epsilon, args.seed):
+                f.write(record + "\n")
+        return
+
+    lines = []
+    for path in args.records:
+        with open(path) as f:
+            lines.extend(line for line in f if line.strip())
+
+    X, y = extractFeatures(lines, args.workers, args.skip)
+    print(f"{len(lines)} games, {len(y)} positions", file=sys.stderr)
+
+    start = np.array([DEFAULT_WEIGHTS[name] for name in FEATURES], dtype=np.float64)
+    weights, k = tune(X, y, DEFAULT_WEIGHTS, args.epochs, args.rate)
+    tuned = np.array([weights[name] for name in FEATURES])
+    print(f"error {error(X, y, start, k):.5f} -> {error(X, y, tuned, k):.5f} (k={k:.5f})", file=sys.stderr)
+
+    with open(args.output, "w") as f:
+        json.dump(weights, f, indent=2)
+    print(json.dumps(weights, indent=2))
+
+
+if __name__ == "__main__":
+    main()
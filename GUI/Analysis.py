@@ -0,0 +1,67 @@
+import threading
+
+from AI.minimax import MiniMax, SearchAborted
+from Logic.Position import Position
+
+
+class BackgroundAnalysis:
+    """Scores every legal move of a position in a background thread, one depth at a time"""
+
+    def __init__(self, depth=2, k=None):
+        self.ai = MiniMax(depth)
+        self.ai.cancel = threading.Event()
+        self.k = k
+        self.position = None      # Position being analysed
+        self.depth = None         # deepest finished depth for self.position
+        self.scores = {}          # move -> score for the side to move
+        self.generation = 0
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def analyse(self, board, turn):
+        """Restart the analysis unless this position is already being analysed"""
+        position = Position.fromBoard(board, turn)
+        with self.lock:
+            if position == self.position:
+                return
+            self.generation += 1
+            self.position = position
+            self.depth = None
+            self.scores = {}
+            generation = self.generation
+
+        self._cancel()
+        self.thread = threading.Thread(target=self._run, args=(generation, position), daemon=True)
+        self.thread.start()
+
+    def _cancel(self):
+        # the old search aborts at its next node, so the wait is short and
+        # only one search ever uses self.ai; its table entries stay valid
+        if self.thread is not None:
+            self.ai.cancel.set()
+            self.thread.join()
+            self.ai.cancel.clear()
+            self.thread = None
+
+    def _run(self, generation, position):
+        try:
+            for depth, results in self.ai.multiPVIterative(position.toBoard(), position.turn, self.k):
+                with self.lock:
+                    if generation != self.generation:
+                        return
+                    self.depth = depth
+                    self.scores = dict(results)
+        except SearchAborted:
+            pass
+
+    def stop(self):
+        with self.lock:
+            self.generation += 1
+            self.position = None
+            self.depth = None
+            self.scores = {}
+        self._cancel()
+
+    def snapshot(self):
+        with self.lock:
+            return self.depth, dict(self.scores)
@@ -0,0 +1,85 @@
+import json
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import pygame as pg
+
+
+class PerfMetrics:
+    """Frame stage timings and AI move latency, shown as an overlay and/or logged as JSON lines"""
+
+    def __init__(self, log_path=None, window=120):
+        self.frames = deque(maxlen=window)   # (frame start, {stage: seconds}, total seconds)
+        self.ai_moves = deque(maxlen=20)
+        self.log = open(log_path, "a") if log_path else None
+        self.frame_start = None
+        self.stages = {}
+        self.frame_number = 0
+
+    def beginFrame(self):
+        self.frame_start = time.perf_counter()
+        self.stages = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - start
+
+    def endFrame(self):
+        if self.frame_start is None:
+            return
+        total = time.perf_counter() - self.frame_start
+        self.frames.append((self.frame_start, self.stages, total))
+        self.frame_number += 1
+        self.write({"type": "frame", "frame": self.frame_number, "total_ms": total * 1000,
+                    "stages_ms": {name: t * 1000 for name, t in self.stages.items()}})
+        self.frame_start = None
+
+    def recordAIMove(self, seconds: float, nodes: int, player: int, move):
+        nps = nodes / seconds if seconds > 0 else 0.0
+        self.ai_moves.append((seconds, nodes, nps))
+        self.write({"type": "ai_move", "frame": self.frame_number, "player": player,
+                    "move": list(move) if move else None, "latency_ms": seconds * 1000,
+                    "nodes": nodes, "nodes_per_sec": nps})
+
+    def write(self, record: dict):
+        if self.log is not None:
+            self.log.write(json.dumps(record) + "\n")
+
+    def fps(self) -> float:
+        if len(self.frames) < 2:
+            return 0.0
+        span = self.frames[-1][0] - self.frames[0][0]
+        return (len(self.frames) - 1) / span if span > 0 else 0.0
+
+    def averageStages(self) -> dict:
+        totals = {}
+        for _, stages, _ in self.frames:
+            for name, t in stages.items():
+                totals[name] = totals.get(name, 0.0) + t
+        return {name: t / len(self.frames) for name, t in totals.items()}
+
+    def draw(self, screen, topleft=(950, 420)):
+        font = pg.font.SysFont('Arial', 16)
+        lines = [f"FPS: {self.fps():.1f}"]
+        if self.frames:
+            lines.append(f"frame: {sum(f[2] for f in self.frames) / len(self.frames) * 1000:.1f} ms")
+        for name, t in self.averageStages().items():
+            lines.append(f"  {name}: {t * 1000:.2f} ms")
+        if self.ai_moves:
+            seconds, nodes, nps = self.ai_moves[-1]
+            lines.append(f"AI: {seconds * 1000:.0f} ms, {nodes} nodes, {nps:.0f} n/s")
+
+        x, y = topleft
+        for line in lines:
+            screen.blit(font.render(line, True, (255, 255, 0)), (x, y))
+            y += 18
+
+    def close(self):
+        if self.log is not None:
+            self.log.close()
+            self.log = None
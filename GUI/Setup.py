@@ -1,9 +1,13 @@
 import pygame as pg
 from pygame.locals import *
 from Logic.Board import Board
+from Logic.Position import Position
 from AI.minimax import AIController
+from GUI.Metrics import PerfMetrics
+from GUI.Analysis import BackgroundAnalysis
 import sys
 import time
+from contextlib import nullcontext
 
 pg.init()
 
@@ -14,10 +18,12 @@ class Game:
     CELL_SIZE = 60
     BOARD_SIZE = 8
     BOARD_TOPLEFT = (100,100)
+    # Easy/Medium/Hard: nodes the AI may search per move, so every move costs about the same
+    NODE_BUDGETS = {1: 300, 2: 1500, 3: 6000}
     board = Board()
     
 
-    def __init__(self):
+    def __init__(self, show_perf=False, perf_log=None):
         self.screen = pg.display.set_mode((Game.SCREEN_WIDTH, 
                                            Game.SCREEN_HEIGHT))
         pg.display.set_caption("myOthello")
@@ -28,6 +34,8 @@ class Game:
         self.turn = self.board.BLACK
 
         self.last_move = -1, -1
+        # snapshot of every position reached in this game, one per ply
+        self.history = [Position.fromBoard(self.board, self.turn)]
         
         # New attributes for game mode
         self.game_mode = None  # "human_vs_human" or "human_vs_computer"
@@ -41,6 +49,14 @@ class Game:
         self.ai_thinking = False
         self.ai_move_delay = 500  # Delay in ms before AI makes move (for better UX)
         self.ai_move_time = 0
+
+        # Performance overlay (toggled with F3) and optional JSON lines log
+        self.show_perf = show_perf
+        self.perf = PerfMetrics(perf_log) if (show_perf or perf_log) else None
+
+        # Move scores for the side to move (toggled with A), searched in the background
+        self.show_analysis = False
+        self.analysis = None
     
     # Drawing the initial empty board
     def drawBoard(self):
@@ -92,6 +108,7 @@ class Game:
 
         if not self.board.findAllPossibleMoves(self.turn) and not self.board.isGameOver():
             self.turn = -self.turn
+            self.updateAnalysis()
 
         if self.board.isGameOver():
             self.announceWinner()
@@ -173,6 +190,8 @@ class Game:
                 self.board.setDiscs(row, col, self.turn)
                 self.turn = -1 * self.turn
                 self.last_move =(col, row)
+                self.history.append(Position.fromBoard(self.board, self.turn))
+                self.updateAnalysis()
     
     def handleAIMove(self):
         """Handle AI move logic"""
@@ -188,6 +207,9 @@ class Game:
                 self.ai_thinking = True
                 self.ai_move_time = current_time
                 self.ai_controller.compute_move(self.board, self.turn)
+                if self.perf is not None:
+                    self.perf.recordAIMove(self.ai_controller.last_time, self.ai_controller.last_nodes,
+                                           self.turn, self.ai_controller.next_move)
             
             # Make the move after delay
             if self.ai_controller.has_move_ready() and (current_time - self.ai_move_time) >= self.ai_move_delay:
@@ -198,6 +220,8 @@ class Game:
                     self.board.setDiscs(row, col, self.turn)
                     self.last_move = (col, row)
                     self.turn = -1 * self.turn
+                    self.history.append(Position.fromBoard(self.board, self.turn))
+                    self.updateAnalysis()
                 self.ai_thinking = False
                
     def announceWinner(self):
@@ -233,6 +257,35 @@ class Game:
 
         self.screen.blit(overlay, (0, 0))
 
+    def updateAnalysis(self):
+        """Point the background analysis at the current position, called whenever it changes"""
+        if not self.show_analysis:
+            return
+        if self.board.isGameOver():
+            self.analysis.stop()
+        else:
+            self.analysis.analyse(self.board, self.turn)
+
+    def showAnalysis(self):
+        """Draw the analysed score of each possible move, refined as deeper searches finish"""
+        if self.analysis.position is None:
+            # stopped, for example because the game is over
+            return
+        depth, scores = self.analysis.snapshot()
+
+        my_font = pg.font.SysFont('Arial', 16)
+        label = "Analysing..." if depth is None else f"Analysis depth: {depth + 1}"
+        self.screen.blit(my_font.render(label, True, (255, 255, 255)), (700, 400))
+        if not scores:
+            return
+
+        best = max(scores.values())
+        for (row, col), score in scores.items():
+            x, y = self.findSquareTopleftCoordsByIndex((row, col))
+            color = (255, 215, 0) if score == best else (200, 200, 200)
+            text = my_font.render(f"{score:g}", True, color)
+            self.screen.blit(text, text.get_rect(center=(x + self.CELL_SIZE // 2, y + self.CELL_SIZE // 2)))
+
     def piecesTracking(self):
         my_font = pg.font.SysFont('Arial', 30) 
         white_num = self.board.whiteDiscCount()
@@ -280,7 +333,8 @@ class Game:
         """Display current AI depth setting"""
         if self.game_mode == "human_vs_computer":
             my_font = pg.font.SysFont('Arial', 20)
-            text_surface = my_font.render(f"AI Depth: {self.ai_depth}", True, (255, 255, 255))
+            text_surface = my_font.render(f"AI Level: {self.ai_depth} ({self.NODE_BUDGETS[self.ai_depth]} nodes/move)",
+                                          True, (255, 255, 255))
             self.screen.blit(text_surface, (700, 250))
 
     def chooseMatchType(self):
@@ -354,7 +408,7 @@ class Game:
         
         # Subtitle
         subtitle_font = pg.font.SysFont('Arial', 24)
-        subtitle = subtitle_font.render('(Search Depth - np parameter)', True, (200, 200, 200))
+        subtitle = subtitle_font.render('(Nodes searched per move)', True, (200, 200, 200))
         subtitle_rect = subtitle.get_rect(center=(self.SCREEN_WIDTH // 2, 150))
         self.screen.blit(subtitle, subtitle_rect)
         
@@ -407,6 +461,10 @@ class Game:
         
         return False
 
+    def createAIController(self) -> AIController:
+        # depth only caps the deepening, the node budget decides how far the AI looks
+        return AIController(60, driver="pvs", nodeBudget=self.NODE_BUDGETS[self.ai_depth])
+
     def chooseRole(self):
         """Display menu for choosing player color in Human vs Computer mode"""
         self.screen.fill((50, 50, 50))
@@ -419,7 +477,8 @@ class Game:
         
         # Show selected depth
         depth_font = pg.font.SysFont('Arial', 24)
-        depth_text = depth_font.render(f'AI Depth: {self.ai_depth}', True, (200, 200, 200))
+        depth_text = depth_font.render(f'AI Level: {self.ai_depth} ({self.NODE_BUDGETS[self.ai_depth]} nodes/move)',
+                                       True, (200, 200, 200))
         depth_rect = depth_text.get_rect(center=(self.SCREEN_WIDTH // 2, 200))
         self.screen.blit(depth_text, depth_rect)
         
@@ -462,13 +521,13 @@ class Game:
             elif event.type == pg.MOUSEBUTTONDOWN:
                 if black_rect.collidepoint(mx, my):
                     self.player_role = self.board.BLACK
-                    self.ai_controller = AIController(self.ai_depth)
+                    self.ai_controller = self.createAIController()
                     self.in_menu = False
                     self.startTime = pg.time.get_ticks()  # Reset timer when game starts
                     return True
                 elif white_rect.collidepoint(mx, my):
                     self.player_role = self.board.WHITE
-                    self.ai_controller = AIController(self.ai_depth)
+                    self.ai_controller = self.createAIController()
                     self.in_menu = False
                     self.startTime = pg.time.get_ticks()  # Reset timer when game starts
                     return True
@@ -490,23 +549,62 @@ class Game:
                 pg.display.flip()
                 continue
             
-            # Handle game
+            if self.perf is not None:
+                self.perf.beginFrame()
+            self.frame()
+            if self.perf is not None:
+                self.perf.endFrame()
+
+    def frame(self) -> None:
+        # Handle game
+        with self.measure("events"):
             for event in pg.event.get():
                 if event.type == QUIT:
-                    pg.quit()
-                    sys.exit()
+                    self.quit()
                 elif event.type == pg.MOUSEBUTTONDOWN:
                     self.handleMouseClick()
-            
-            # Handle AI move if in human vs computer mode
+                elif event.type == pg.KEYDOWN and event.key == pg.K_F3:
+                    self.show_perf = not self.show_perf
+                    if self.perf is None:
+                        self.perf = PerfMetrics()
+                elif event.type == pg.KEYDOWN and event.key == pg.K_a:
+                    self.show_analysis = not self.show_analysis
+                    if self.analysis is None:
+                        self.analysis = BackgroundAnalysis(self.ai_depth)
+                    if self.show_analysis:
+                        self.updateAnalysis()
+                    else:
+                        self.analysis.stop()
+        
+        # Handle AI move if in human vs computer mode
+        with self.measure("handleAIMove"):
             self.handleAIMove()
-            
+        
+        with self.measure("drawBoard"):
             self.screen.fill((50, 50, 50))      # background color
             self.drawBoard()
+        with self.measure("redrawBoard"):
             self.redrawBoard()
+        with self.measure("overlays"):
             self.currentTurn()
             self.hover()
             self.timeLapse()
             self.lastMove()
             self.showAIDepth()
-            pg.display.flip()
\ No newline at end of file
+            if self.show_analysis:
+                self.showAnalysis()
+            if self.show_perf and self.perf is not None:
+                self.perf.draw(self.screen)
+        with self.measure("flip"):
+            pg.display.flip()
+
+    def measure(self, name: str):
+        if self.perf is None:
+            return nullcontext()
+        return self.perf.stage(name)
+
+    def quit(self) -> None:
+        if self.perf is not None:
+            self.perf.close()
+        pg.quit()
+        sys.exit()
\ No newline at end of file
@@ -0,0 +1,132 @@
+import numpy as np
+from Logic.Board import Board
+
+# Positions are uint64 bitboards, bit (row * 8 + col) set when that square is
+# occupied. Functions take the side to move ("player") and the other side
+# ("opponent") as arrays of N boards and work on all of them at once.
+
+NOT_COL_0 = np.uint64(0xFEFEFEFEFEFEFEFE)
+NOT_COL_7 = np.uint64(0x7F7F7F7F7F7F7F7F)
+ZERO = np.uint64(0)
+
+# (shift, mask applied after the shift) for the eight directions of Board.moves
+_DIRECTIONS = [
+    (-8, None),        # up
+    (8, None),         # down
+    (1, NOT_COL_0),    # right
+    (-1, NOT_COL_7),   # left
+    (-7, NOT_COL_0),   # up right
+    (9, NOT_COL_0),    # down right
+    (7, NOT_COL_7),    # down left
+    (-9, NOT_COL_7),   # up left
+]
+
+_WEIGHTS = np.uint64(1) << np.arange(64, dtype=np.uint64)
+
+
+def _shift(x: np.ndarray, amount: int, mask) -> np.ndarray:
+    if amount > 0:
+        x = x << np.uint64(amount)
+    else:
+        x = x >> np.uint64(-amount)
+    if mask is not None:
+        x = x & mask
+    return x
+
+
+def pack(boards: np.ndarray):
+    """N x 8 x 8 arrays of Board values -> (black, white) uint64 arrays"""
+    boards = np.asarray(boards).reshape(-1, 64)
+    black = ((boards == Board.BLACK) * _WEIGHTS).sum(axis=1, dtype=np.uint64)
+    white = ((boards == Board.WHITE) * _WEIGHTS).sum(axis=1, dtype=np.uint64)
+    return black, white
+
+
+def unpack(black: np.ndarray, white: np.ndarray) -> np.ndarray:
+    """(black, white) uint64 arrays -> N x 8 x 8 int64 arrays of Board values"""
+    black_bits = (np.asarray(black, dtype=np.uint64)[:, None] & _WEIGHTS) != 0
+    white_bits = (np.asarray(white, dtype=np.uint64)[:, None] & _WEIGHTS) != 0
+    boards = black_bits.astype(np.int64) * Board.BLACK + white_bits.astype(np.int64) * Board.WHITE
+    return boards.reshape(-1, 8, 8)
+
+
+def fromBoards(boards: list, turns) -> tuple:
+    """Board objects and sides to move -> (player, opponent) arrays"""
+    black, white = pack(np.stack([board.board for board in boards]))
+    black_to_move = np.asarray(turns) == Board.BLACK
+    return np.where(black_to_move, black, white), np.where(black_to_move, white, black)
+
+
+def popcount(x: np.ndarray) -> np.ndarray:
+    x = np.asarray(x, dtype=np.uint64)
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(x).astype(np.int64)
+    x = x - ((x >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    x = (x & np.uint64(0x3333333333333333)) + ((x >> np.uint64(2)) & np.uint64(0x3333333333333333))
+    x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return ((x * np.uint64(0x0101010101010101)) >> np.uint64(56)).astype(np.int64)
+
+
+def legalMoves(player: np.ndarray, opponent: np.ndarray) -> np.ndarray:
+    """Bitmask of the legal moves of the side to move for every position"""
+    empty = ~(player | opponent)
+    moves = np.zeros_like(player)
+    for amount, mask in _DIRECTIONS:
+        run = _shift(player, amount, mask) & opponent
+        for _ in range(5):
+            run |= _shift(run, amount, mask) & opponent
+        moves |= _shift(run, amount, mask) & empty
+    return moves
+
+
+def flips(player: np.ndarray, opponent: np.ndarray, move: np.ndarray) -> np.ndarray:
+    """Discs flipped by playing the single-bit move (0 for a pass) in every position"""
+    flipped = np.zeros_like(player)
+    for amount, mask in _DIRECTIONS:
+        run = _shift(move, amount, mask) & opponent
+        for _ in range(5):
+            run |= _shift(run, amount, mask) & opponent
+        closed = (_shift(run, amount, mask) & player) != ZERO
+        flipped |= np.where(closed, run, ZERO)
+    return flipped
+
+
+def applyMoves(player: np.ndarray, opponent: np.ndarray, move: np.ndarray) -> tuple:
+    """Play the moves and return the new (player, opponent), still from the mover's side"""
+    flipped = flips(player, opponent, move)
+    return player | move | flipped, opponent & ~flipped
+
+
+def squareBits(squares) -> np.ndarray:
+    """Square indices (row * 8 + col, -1 for a pass) -> single-bit move masks"""
+    squares = np.asarray(squares, dtype=np.int64)
+    return np.where(squares >= 0, np.uint64(1) << np.maximum(squares, 0).astype(np.uint64), ZERO)
+
+
+def randomMoves(moves: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Pick one legal move uniformly from every mask, 0 where there is none"""
+    bits = (moves[:, None] & _WEIGHTS) != ZERO
+    choice = np.argmax(rng.random(bits.shape) * bits, axis=1)
+    return np.where(moves != ZERO, _WEIGHTS[choice], ZERO)
+
+
+def randomPlayouts(player: np.ndarray, opponent: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Play every position out with uniformly random moves in lockstep.
+
+    Returns the final disc difference from the point of view of the side to
+    move in the starting position.
+    """
+    player = np.array(player, dtype=np.uint64)
+    opponent = np.array(opponent, dtype=np.uint64)
+    flipped_sides = np.zeros(len(player), dtype=bool)
+    passes = np.zeros(len(player), dtype=np.int64)
+
+    while (passes < 2).any():
+        moves = legalMoves(player, opponent)
+        passes = np.where(moves == ZERO, passes + 1, 0)
+        player, opponent = applyMoves(player, opponent, randomMoves(moves, rng))
+        player, opponent = opponent, player
+        flipped_sides = ~flipped_sides
+
+    diff = popcount(player) - popcount(opponent)
+    return np.where(flipped_sides, -diff, diff)
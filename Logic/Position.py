@@ -0,0 +1,62 @@
+import numpy as np
+from Logic.Board import Board
+
+
+class Position:
+    """Immutable, hashable snapshot of a board and the side to move.
+
+    Each colour is packed into a 64-bit int with bit (row * 8 + col) set for
+    its discs, the same layout as Logic.BatchBoard, so a snapshot is a few
+    machine words and cheap to keep for every ply or use as a dict key.
+    """
+
+    __slots__ = ("black", "white", "turn")
+
+    def __init__(self, black: int, white: int, turn: int):
+        if black & white:
+            raise ValueError("a square cannot hold both colours")
+        object.__setattr__(self, "black", black)
+        object.__setattr__(self, "white", white)
+        object.__setattr__(self, "turn", turn)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Position is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Position is immutable")
+
+    @classmethod
+    def fromBoard(cls, board: Board, turn: int) -> "Position":
+        cells = board.board.reshape(64)
+        black = np.packbits(cells == Board.BLACK, bitorder="little").tobytes()
+        white = np.packbits(cells == Board.WHITE, bitorder="little").tobytes()
+        return cls(int.from_bytes(black, "little"), int.from_bytes(white, "little"), turn)
+
+    def toBoard(self) -> Board:
+        board = Board()
+        black = np.unpackbits(np.frombuffer(self.black.to_bytes(8, "little"), dtype=np.uint8), bitorder="little")
+        white = np.unpackbits(np.frombuffer(self.white.to_bytes(8, "little"), dtype=np.uint8), bitorder="little")
+        board.board = (black.astype(np.int64) * Board.BLACK + white.astype(np.int64) * Board.WHITE).reshape(8, 8)
+        board.black_disc_count = self.blackDiscCount()
+        board.white_disc_count = self.whiteDiscCount()
+        return board
+
+    def blackDiscCount(self) -> int:
+        return self.black.bit_count()
+
+    def whiteDiscCount(self) -> int:
+        return self.white.bit_count()
+
+    def __eq__(self, other):
+        if not isinstance(other, Position):
+            return NotImplemented
+        return self.black == other.black and self.white == other.white and self.turn == other.turn
+
+    def __hash__(self):
+        return hash((self.black, self.white, self.turn))
+
+    def __reduce__(self):
+        return Position, (self.black, self.white, self.turn)
+
+    def __repr__(self):
+        return f"Position(black={self.black:#018x}, white={self.white:#018x}, turn={self.turn})"
@@ -0,0 +1,86 @@
+import numpy as np
+from Logic.Board import Board
+
+# A game record is one line of moves in board notation, column letter then
+# row number ("d3 c5 f6 ..."), black moving first. Passes are not written,
+# the side to move is worked out while replaying.
+
+COLUMNS = "abcdefgh"
+
+
+def formatMove(move: tuple) -> str:
+    row, col = move
+    return f"{COLUMNS[col]}{row + 1}"
+
+
+def parseMove(text: str) -> tuple:
+    text = text.strip().lower()
+    if len(text) != 2 or text[0] not in COLUMNS or not "1" <= text[1] <= "8":
+        raise ValueError(f"bad move {text!r}, expected something like 'd3'")
+    return int(text[1]) - 1, COLUMNS.index(text[0])
+
+
+def formatGame(moves: list) -> str:
+    return " ".join(formatMove(move) for move in moves)
+
+
+def parseGame(line: str) -> list:
+    return [parseMove(token) for token in line.split()]
+
+
+def replay(moves: list):
+    """Yield (board, turn) before every move, then the final (board, None).
+
+    The same Board object is updated in place between steps.
+    """
+    board = Board()
+    turn = Board.BLACK
+    for move in moves:
+        legal = board.findAllPossibleMoves(turn)
+        if not legal:
+            turn = -turn
+            legal = board.findAllPossibleMoves(turn)
+        if move not in legal:
+            raise ValueError(f"illegal move {formatMove(move)} in game record")
+        yield board, turn
+        row, col = move
+        board.board[row, col] = turn
+        board.setDiscs(row, col, turn)
+        turn = -turn
+    yield board, None
+
+
+def result(board: Board) -> int:
+    """Winner of a finished board by disc count: Board.BLACK, Board.WHITE or 0"""
+    balance = int(np.sum(board.board))
+    return Board.BLACK if balance > 0 else Board.WHITE if balance < 0 else Board.EMPTY
+
+
+# A position is 64 squares row by row, 'X' for black, 'O' for white and '-'
+# for empty, then the side to move: "---...XO... X". Anything after that is
+# ignored, so a position line can carry a name or comment.
+
+SQUARES = {"X": Board.BLACK, "O": Board.WHITE, "-": Board.EMPTY}
+
+
+def parsePosition(line: str) -> tuple:
+    """(board, turn) from a position line"""
+    fields = line.split()
+    if len(fields) < 2 or len(fields[0]) != 64 or fields[1].upper() not in ("X", "O"):
+        raise ValueError(f"bad position {line.strip()!r}, expected 64 squares of X/O/- and the side to move")
+    try:
+        cells = [SQUARES[square] for square in fields[0].upper()]
+    except KeyError as e:
+        raise ValueError(f"bad square {e.args[0]!r} in position") from None
+
+    board = Board()
+    board.board = np.array(cells, dtype=np.int64).reshape(8, 8)
+    board.black_disc_count = board.blackDiscCount()
+    board.white_disc_count = board.whiteDiscCount()
+    return board, Board.BLACK if fields[1].upper() == "X" else Board.WHITE
+
+
+def formatPosition(board: Board, turn: int) -> str:
+    symbols = {value: symbol for symbol, value in SQUARES.items()}
+    squares = "".join(symbols[int(cell)] for cell in board.board.reshape(64))
+    return f"{squares} {'X' if turn == Board.BLACK else 'O'}"
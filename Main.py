@@ -1,4 +1,10 @@
+import argparse
 from GUI.Setup import Game
 
-game = Game()
+parser = argparse.ArgumentParser(description="myOthello")
+parser.add_argument("--perf", action="store_true", help="show the performance overlay (toggle with F3)")
+parser.add_argument("--perf-log", help="append frame and AI timings to this file as JSON lines")
+args = parser.parse_args()
+
+game = Game(show_perf=args.perf, perf_log=args.perf_log)
 game.start()
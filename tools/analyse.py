@@ -0,0 +1,83 @@
+import argparse
+import json
+import multiprocessing
+import sys
+import time
+
+from AI.minimax import MiniMax
+from Logic import Record
+
+_engine = None
+
+
+def _initWorker(depth, timeLimit, nodeBudget, driver):
+    global _engine
+    _engine = MiniMax(depth, driver=driver, timeLimit=timeLimit, nodeBudget=nodeBudget)
+
+
+def _analyse(job) -> dict:
+    number, line = job
+    result = {"line": number, "position": line}
+    try:
+        board, turn = Record.parsePosition(line)
+    except ValueError as e:
+        result["error"] = str(e)
+        return result
+
+    start = time.perf_counter()
+    move = _engine.minimaxDecision(board, turn)
+    elapsed = time.perf_counter() - start
+    result.update({
+        "best": Record.formatMove(move) if move else None,
+        "score": _engine.lastScore if move else None,
+        "depth": _engine.completedDepth,
+        "nodes": _engine.nodes,
+        "time": round(elapsed, 4),
+    })
+    return result
+
+
+def readPositions(stream):
+    """(line number, position text) for every non-blank, non-comment line"""
+    for number, line in enumerate(stream, 1):
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield number, line
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Analyse positions headlessly and stream one JSON object per position. "
+                    "Scores are for the side to move.")
+    parser.add_argument("input", nargs="?", default="-", help="position file, '-' for stdin")
+    parser.add_argument("--depth", type=int, default=None,
+                        help="search depth (plies below each root move, as in the game)")
+    parser.add_argument("--time", type=float, default=None, help="seconds per position")
+    parser.add_argument("--nodes", type=int, default=None,
+                        help="node budget per position, gives reproducible results")
+    parser.add_argument("--driver", choices=MiniMax.DRIVERS, default="pvs")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--ordered", action="store_true", help="write results in input order")
+    args = parser.parse_args(argv)
+
+    limited = args.time is not None or args.nodes is not None
+    if args.depth is None and not limited:
+        args.depth = 2
+    if limited and args.driver == "minimax":
+        parser.error("--time and --nodes need the pvs or mtdf driver")
+    depth = args.depth if args.depth is not None else 60
+
+    stream = sys.stdin if args.input == "-" else open(args.input)
+    try:
+        with multiprocessing.Pool(args.workers, _initWorker, (depth, args.time, args.nodes, args.driver)) as pool:
+            analyse = pool.imap if args.ordered else pool.imap_unordered
+            for result in analyse(_analyse, readPositions(stream)):
+                sys.stdout.write(json.dumps(result) + "\n")
+                sys.stdout.flush()
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import argparse
+import time
+
+from AI.minimax import MiniMax
+from AI.probcut import samplePositions
+
+
+def benchmark(positions: list, depth: int, drivers=MiniMax.DRIVERS) -> dict:
+    """Search every position with each driver at the same depth, with a fresh table per position"""
+    results = {}
+    reference = None
+
+    for driver in drivers:
+        nodes = 0
+        elapsed = 0.0
+        moves = []
+        for board, turn in positions:
+            ai = MiniMax(depth, driver=driver)
+            start = time.perf_counter()
+            moves.append((ai.minimaxDecision(board, turn), ai.lastScore))
+            elapsed += time.perf_counter() - start
+            nodes += ai.nodes
+
+        if reference is None:
+            reference = moves
+        agree = sum(1 for (_, a), (_, b) in zip(moves, reference) if a == b)
+        results[driver] = {"nodes": nodes, "time": elapsed, "sameScore": agree}
+
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare MiniMax search drivers at equal depth")
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--games", type=int, default=2)
+    parser.add_argument("--every", type=int, default=6, help="keep every n-th sampled position")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    positions = samplePositions(args.games, args.seed)[::args.every]
+    print(f"{len(positions)} positions, depth {args.depth}")
+    print(f"{'driver':<8} {'nodes':>10} {'time (s)':>10} {'nodes/s':>10} {'same score':>11}")
+    for driver, r in benchmark(positions, args.depth).items():
+        print(f"{driver:<8} {r['nodes']:>10} {r['time']:>10.2f} {r['nodes'] / r['time']:>10.0f} "
+              f"{r['sameScore']:>5}/{len(positions)}")
+
+
+if __name__ == "__main__":
+    main()
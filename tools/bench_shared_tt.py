@@ -0,0 +1,63 @@
+import argparse
+import multiprocessing
+import time
+
+from AI.minimax import MiniMax
+from AI.probcut import samplePositions
+from AI.sharedtt import SharedTranspositionTable
+
+
+def _searchMoves(job) -> tuple:
+    """Search a worker's share of root moves; tt is None for a private table"""
+    tt, tasks, depth = job
+    ai = MiniMax(depth, tt=tt)
+    for board, turn, move in tasks:
+        ai.negamax(ai.play(board, move, turn), -turn, depth, float('-inf'), float('inf'))
+    return ai.nodes, ai.tt.probes, ai.tt.hits
+
+
+def run(tasks: list, depth: int, workers: int, shared: bool) -> dict:
+    tt = SharedTranspositionTable() if shared else None
+    # deal root moves round robin, like a split of the root between workers
+    jobs = [(tt, tasks[i::workers], depth) for i in range(workers)]
+    try:
+        start = time.perf_counter()
+        with multiprocessing.Pool(workers) as pool:
+            results = pool.map(_searchMoves, jobs)
+        elapsed = time.perf_counter() - start
+    finally:
+        if tt is not None:
+            tt.close()
+
+    nodes, probes, hits = (sum(r[i] for r in results) for i in range(3))
+    return {"time": elapsed, "nodes": nodes, "hitRate": hits / probes if probes else 0.0}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Shared vs private transposition tables across worker processes")
+    parser.add_argument("--depth", type=int, default=3, help="plies searched below every root move")
+    parser.add_argument("--workers", default="1,2,4")
+    parser.add_argument("--games", type=int, default=1)
+    parser.add_argument("--every", type=int, default=8, help="keep every n-th sampled position")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    positions = samplePositions(args.games, args.seed)[::args.every]
+    tasks = [(board, turn, move) for board, turn in positions
+             for move in sorted(board.findAllPossibleMoves(turn))]
+    print(f"{len(positions)} positions, {len(tasks)} root moves, depth {args.depth}, "
+          f"{multiprocessing.cpu_count()} cpus")
+    print(f"{'workers':>7} {'table':>8} {'time (s)':>9} {'speedup':>8} {'nodes':>8} {'hit rate':>9}")
+
+    baseline = None
+    for workers in (int(n) for n in args.workers.split(",")):
+        for shared in (False, True):
+            r = run(tasks, args.depth, workers, shared)
+            if baseline is None:
+                baseline = r["time"]
+            print(f"{workers:>7} {'shared' if shared else 'private':>8} {r['time']:>9.2f} "
+                  f"{baseline / r['time']:>8.2f} {r['nodes']:>8} {r['hitRate']:>9.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+import argparse
+import math
+import multiprocessing
+import random
+import sys
+
+from AI.minimax import AIController, MiniMax
+from Logic.Board import Board
+from Logic import Record
+
+# An engine spec is "kind:option=value,...", for example "pvs:time=0.2",
+# "pvs:nodes=2000", "minimax:depth=2" or "mcts:playouts=300". Kinds are the
+# MiniMax drivers and "mcts"; options are passed on to the engine. Give both
+# engines the same "time" or "nodes" for an equal time or node budget; for mcts
+# "nodes" is the playout count. Games already run in worker processes, so mcts
+# engines search in-process here.
+
+
+def parseEngine(spec: str) -> tuple:
+    kind, _, rest = spec.partition(":")
+    if kind not in MiniMax.DRIVERS + ("mcts",):
+        raise ValueError(f"unknown engine kind {kind!r} in {spec!r}")
+    options = {}
+    for item in filter(None, rest.split(",")):
+        name, _, value = item.partition("=")
+        for convert in (int, float):
+            try:
+                value = convert(value)
+                break
+            except ValueError:
+                pass
+        options[name] = value
+    if kind == "mcts" and options.get("workers", 1) != 1:
+        raise ValueError("mcts engines cannot start their own workers inside the match harness")
+    return kind, options
+
+
+def makeEngine(kind: str, options: dict) -> AIController:
+    options = dict(options)
+    if kind == "mcts":
+        timeLimit = options.pop("time", None)
+        if "nodes" in options:
+            options["playouts"] = options.pop("nodes")
+        return AIController(0, engine="mcts", timeLimit=timeLimit, **options)
+
+    depth = options.pop("depth", 60 if "time" in options or "nodes" in options else 2)
+    timeLimit = options.pop("time", None)
+    nodeBudget = options.pop("nodes", None)
+    return AIController(depth, engine="minimax", driver=kind, timeLimit=timeLimit,
+                        nodeBudget=nodeBudget, **options)
+
+
+def randomOpenings(count: int, plies: int, seed: int) -> list:
+    """Distinct random move sequences to start games from"""
+    rng = random.Random(seed)
+    openings = set()
+    for _ in range(count * 20):
+        if len(openings) == count:
+            break
+        board, turn, moves = Board(), Board.BLACK, []
+        for _ in range(plies):
+            legal = sorted(board.findAllPossibleMoves(turn))
+            if not legal:
+                break
+            move = rng.choice(legal)
+            row, col = move
+            board.board[row, col] = turn
+            board.setDiscs(row, col, turn)
+            moves.append(move)
+            turn = -turn
+        openings.add(tuple(moves))
+    return sorted(openings)
+
+
+def playGame(job) -> tuple:
+    """Play one game from an opening, returns (score for engine A, game record)"""
+    opening, engineA, engineB, aIsBlack = job
+    engines = {Board.BLACK: makeEngine(*engineA), Board.WHITE: makeEngine(*engineB)}
+    if not aIsBlack:
+        engines = {Board.BLACK: engines[Board.WHITE], Board.WHITE: engines[Board.BLACK]}
+
+    moves = list(opening)
+    turn = Board.BLACK
+    for board, mover in Record.replay(moves):
+        if mover is not None:
+            turn = -mover
+
+    passed = False
+    while True:
+        if not board.findAllPossibleMoves(turn):
+            if passed:
+                break
+            passed = True
+            turn = -turn
+            continue
+        passed = False
+        move = engines[turn].decide(board, turn)
+        row, col = move
+        board.board[row, col] = turn
+        board.setDiscs(row, col, turn)
+        moves.append(move)
+        turn = -turn
+
+    for engine in engines.values():
+        if hasattr(engine.ai, "close"):
+            engine.ai.close()
+
+    winner = Record.result(board)
+    aColour = Board.BLACK if aIsBlack else Board.WHITE
+    score = 0.5 if winner == Board.EMPTY else float(winner == aColour)
+    return score, Record.formatGame(moves)
+
+
+def expectedScore(elo: float) -> float:
+    return 1.0 / (1.0 + 10 ** (-elo / 400))
+
+
+def eloFromScore(score: float) -> float:
+    score = min(max(score, 1e-6), 1 - 1e-6)
+    return -400 * math.log10(1 / score - 1)
+
+
+def sprt(scores: list, elo0: float, elo1: float) -> float:
+    """Log-likelihood ratio of H1 (elo1) against H0 (elo0) for per-game scores.
+
+    Uses the normal approximation of the generalised SPRT over win/draw/loss
+    frequencies, which handles draws through the variance of the scores.
+    Each outcome gets half a game of prior weight, so a clean sweep still
+    has a variance and can stop the test.
+    """
+    n = len(scores)
+    if n < 2:
+        return 0.0
+    prior = 0.5
+    counts = {1.0: prior, 0.5: prior, 0.0: prior}
+    for s in scores:
+        counts[s] += 1
+    total = sum(counts.values())
+    mean = sum(s * c for s, c in counts.items()) / total
+    var = sum((s - mean) ** 2 * c for s, c in counts.items()) / total
+    s0, s1 = expectedScore(elo0), expectedScore(elo1)
+    return n * (s1 - s0) * (2 * mean - s0 - s1) / (2 * var)
+
+
+def summary(scores: list) -> str:
+    n = len(scores)
+    wins = sum(1 for s in scores if s == 1.0)
+    draws = sum(1 for s in scores if s == 0.5)
+    mean = sum(scores) / n
+    var = sum((s - mean) ** 2 for s in scores) / n
+    margin = 1.96 * math.sqrt(var / n)
+    elo = eloFromScore(mean)
+    low, high = eloFromScore(mean - margin), eloFromScore(mean + margin)
+    return (f"games {n}  W/D/L {wins}/{draws}/{n - wins - draws}  score {mean:.3f}  "
+            f"elo {elo:+.1f} [{low:+.1f}, {high:+.1f}]")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play engine A against engine B and run an SPRT on the result")
+    parser.add_argument("engineA", help='e.g. "pvs:time=0.2"')
+    parser.add_argument("engineB", help='e.g. "minimax:depth=2"')
+    parser.add_argument("--openings", help="file of opening move records, one per line")
+    parser.add_argument("--random-openings", type=int, default=50)
+    parser.add_argument("--opening-plies", type=int, default=6)
+    parser.add_argument("--rounds", type=int, default=1, help="times to play through the opening set")
+    parser.add_argument("--elo0", type=float, default=0.0)
+    parser.add_argument("--elo1", type=float, default=20.0)
+    parser.add_argument("--alpha", type=float, default=0.05)
+    parser.add_argument("--beta", type=float, default=0.05)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--records", help="append played games to this file")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    engineA, engineB = parseEngine(args.engineA), parseEngine(args.engineB)
+    if args.openings:
+        with open(args.openings) as f:
+            openings = [tuple(Record.parseGame(line)) for line in f if line.strip()]
+    else:
+        openings = randomOpenings(args.random_openings, args.opening_plies, args.seed)
+
+    # every opening is played with both colours so neither engine gets the better side
+    jobs = [(opening, engineA, engineB, aIsBlack)
+            for _ in range(args.rounds) for opening in openings for aIsBlack in (True, False)]
+    lower = math.log(args.beta / (1 - args.alpha))
+    upper = math.log((1 - args.beta) / args.alpha)
+    print(f"{len(jobs)} games max, SPRT elo0={args.elo0} elo1={args.elo1} bounds [{lower:.2f}, {upper:.2f}]")
+
+    scores = []
+    verdict = "inconclusive"
+    records = open(args.records, "a") if args.records else None
+    with multiprocessing.Pool(args.workers) as pool:
+        for score, record in pool.imap_unordered(playGame, jobs):
+            scores.append(score)
+            if records is not None:
+                records.write(record + "\n")
+            llr = sprt(scores, args.elo0, args.elo1)
+            print(f"{summary(scores)}  LLR {llr:+.2f}", file=sys.stderr)
+            if llr >= upper:
+                verdict = "H1 accepted: A is stronger by at least elo1"
+                break
+            if llr <= lower:
+                verdict = "H0 accepted: A is not stronger by elo1"
+                break
+        pool.terminate()
+    if records is not None:
+        records.close()
+
+    print(summary(scores))
+    print(f"LLR {sprt(scores, args.elo0, args.elo1):+.2f}  {verdict}")
+
+
+if __name__ == "__main__":
+    main()
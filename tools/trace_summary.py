@@ -0,0 +1,42 @@
+import argparse
+from collections import Counter, defaultdict
+
+from AI.trace import REASONS, readTrace
+from Logic import Record
+
+
+def summarise(records) -> tuple:
+    """Node and return-reason counts by ply and by root move"""
+    byPly = defaultdict(Counter)
+    byRoot = defaultdict(Counter)
+    for moves, depth, alpha, beta, value, reason in records:
+        byPly[len(moves)][reason] += 1
+        root = Record.formatMove(moves[0]) if moves else "root"
+        byRoot[root][reason] += 1
+    return byPly, byRoot
+
+
+def _table(title: str, rows: dict) -> list:
+    total = sum(sum(counts.values()) for counts in rows.values())
+    lines = [f"{title:<8} {'nodes':>8} {'share':>6} " + " ".join(f"{r:>7}" for r in REASONS)]
+    for key, counts in rows.items():
+        nodes = sum(counts.values())
+        lines.append(f"{key!s:<8} {nodes:>8} {nodes / total:>6.1%} "
+                     + " ".join(f"{counts[r]:>7}" for r in REASONS))
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarise where a MiniMax search trace spent its nodes")
+    parser.add_argument("trace", help="file written by SearchTracer")
+    args = parser.parse_args(argv)
+
+    byPly, byRoot = summarise(readTrace(args.trace))
+    print("\n".join(_table("ply", dict(sorted(byPly.items())))))
+    print()
+    ordered = sorted(byRoot.items(), key=lambda item: -sum(item[1].values()))
+    print("\n".join(_table("move", dict(ordered))))
+
+
+if __name__ == "__main__":
+    main()